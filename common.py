@@ -0,0 +1,17 @@
+from functools import lru_cache
+from web3 import Web3
+
+
+@lru_cache(maxsize=4096)
+def to_checksum(address):
+    """
+    Convert an address to checksum format, memoized
+
+    to_checksum_address runs a keccak256 hash per call, and wallet lists
+    are commonly duplicated across chains, so caching means each distinct
+    address is hashed only once at startup.
+
+    :param address: Address string in any casing
+    :return: Checksummed address string
+    """
+    return Web3.to_checksum_address(address)
@@ -1,7 +1,12 @@
 import os
+import re
 import pytest
 from dotenv import load_dotenv
 
+# Precompiled once so each address check is a single C-level match instead
+# of a Python-level per-character loop
+ETH_ADDRESS_PATTERN = re.compile(r'0x[0-9a-fA-F]{40}\Z')
+
 def test_environment_variables():
     """
     Test that critical environment variables are set
@@ -33,9 +38,7 @@ def test_wallet_address_format():
     """
     def is_valid_eth_address(address):
         # Basic check for 0x prefix and 40 hex characters
-        return (len(address) == 42 and 
-                address.startswith('0x') and 
-                all(c in '0123456789ABCDEFabcdef' for c in address[2:]))
+        return bool(ETH_ADDRESS_PATTERN.fullmatch(address))
 
     ethereum_wallets = os.getenv('ETHEREUM_WALLETS', '').split(',')
     base_wallets = os.getenv('BASE_WALLETS', '').split(',')